@@ -1,7 +1,8 @@
 from ._client import CapyDB
+from ._async_client import AsyncCapyDB
 from ._ejson._text import Text
 from ._ejson._models import Models
 from ._ejson._image import Image
 import bson
 
-__all__ = ["CapyDB", "Text", "Models", "Image", "bson"]
+__all__ = ["CapyDB", "AsyncCapyDB", "Text", "Models", "Image", "bson"]
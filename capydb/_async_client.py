@@ -0,0 +1,94 @@
+import asyncio
+from capydb._client import _load_credentials, _load_encoder
+from capydb._async_database import AsyncDatabase
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, installed with the "async" extra
+    aiohttp = None
+
+
+class AsyncCapyDB:
+    """Asynchronous client for interacting with CapyDB.
+
+    Requires CAPYDB_PROJECT_ID and CAPYDB_API_KEY environment variables and
+    the optional aiohttp dependency (pip install "capydb[async]").
+
+    The HTTP session belongs to the event loop it was created on and is
+    recreated when used from another loop. Use the client as an async context
+    manager (or await close()) in each loop so sessions are closed cleanly.
+    """
+
+    def __init__(self):
+        """Initialize AsyncCapyDB client from environment variables."""
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncCapyDB requires aiohttp. Install it with: pip install \"capydb[async]\""
+            )
+
+        self._databases: dict[str, AsyncDatabase] = {}
+        self.project_id, self.api_key = _load_credentials()
+        self._encoder = _load_encoder()
+        self._session = None
+        self._session_loop = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the aiohttp session for the running event loop, creating it as needed."""
+        loop = asyncio.get_running_loop()
+        # A session is bound to the loop it was created on; after e.g. a second
+        # asyncio.run() the old one is unusable, so start a fresh session
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session_loop = loop
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=50, ttl_dns_cache=300
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        # A session left over from a finished loop cannot be closed from here
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is asyncio.get_running_loop()
+        ):
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self) -> "AsyncCapyDB":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def db(self, db_name: str) -> AsyncDatabase:
+        """Get database by name; repeated lookups return the same instance."""
+        database = self._databases.get(db_name)
+        if database is None:
+            database = self._databases.setdefault(
+                db_name,
+                AsyncDatabase(
+                    self.api_key,
+                    self.project_id,
+                    db_name,
+                    self._get_session,
+                    encoder=self._encoder,
+                ),
+            )
+        return database
+
+    def __getattr__(self, name):
+        """Allow db access via attribute: client.my_database"""
+        return self.db(name)
+
+    def __getitem__(self, name):
+        """Allow db access via dictionary: client["my_database"]"""
+        return self.db(name)
@@ -0,0 +1,146 @@
+import asyncio
+from typing import Any, Callable
+from ._types import QueryResponse
+from ._serialization import dumps, encode
+from ._collection import _parse_response
+
+
+class AsyncCollection:
+    """Asynchronous counterpart of Collection, backed by aiohttp."""
+
+    def __init__(
+        self,
+        api_key: str,
+        project_id: str,
+        db_name: str,
+        collection_name: str,
+        get_session: Callable,
+        encoder: Callable[[Any], bytes] = encode,
+    ):
+        """Initialize collection instance."""
+        self.api_key = api_key
+        self.project_id = project_id
+        self.db_name = db_name
+        self.collection_name = collection_name
+
+        # Endpoints never change for a collection, build them once
+        self._collection_url = f"https://api.capydb.com/v1/db/{project_id}_{db_name}/collection/{collection_name}"
+        self._document_url = f"{self._collection_url}/document"
+        self._find_url = f"{self._document_url}/find"
+        self._query_url = f"{self._document_url}/query"
+        # aiohttp sessions must be created inside a running event loop, so the
+        # client hands out its session lazily
+        self._get_session = get_session
+        # Wire formats are chosen by the client, see make_encoder()
+        self._encode = encoder
+
+    def get_collection_url(self) -> str:
+        return self._document_url
+
+    async def _request(self, method: str, url: str, data: dict) -> tuple[int, bytes]:
+        """Send a form-encoded request and return status code and raw body."""
+        # aiohttp turns bytes form values into multipart file parts
+        data = {k: v.decode() if isinstance(v, bytes) else v for k, v in data.items()}
+        session = self._get_session()
+        async with session.request(method, url, data=data) as response:
+            return response.status, await response.read()
+
+    def handle_response(self, status: int, body: bytes):
+        return _parse_response(status, body)
+
+    async def ainsert(self, documents: list[dict]) -> dict:
+        """Insert documents into the collection."""
+        url = self._document_url
+
+        data = {"documents": self._encode(documents)}
+
+        return self.handle_response(*await self._request("POST", url, data))
+
+    async def aupdate(self, filter: dict, update: dict, upsert: bool = False) -> dict:
+        """Update documents matching filter."""
+        url = self._document_url
+
+        data = {
+            "filter": self._encode(filter),
+            "update": self._encode(update),
+            "upsert": str(upsert).lower(),
+        }
+
+        return self.handle_response(*await self._request("PUT", url, data))
+
+    async def adelete(self, filter: dict) -> dict:
+        """Delete documents matching filter."""
+        url = self._document_url
+
+        data = {"filter": self._encode(filter)}
+
+        return self.handle_response(*await self._request("DELETE", url, data))
+
+    async def afind(
+        self,
+        filter: dict,
+        projection: dict = None,
+        sort: dict = None,
+        limit: int = None,
+        skip: int = None,
+    ) -> list[dict]:
+        """Find documents matching filter."""
+        url = self._find_url
+
+        data = {"filter": self._encode(filter)}
+
+        if projection is not None:
+            data["projection"] = dumps(projection)
+        if sort is not None:
+            data["sort"] = dumps(sort)
+        if limit is not None:
+            data["limit"] = str(limit)
+        if skip is not None:
+            data["skip"] = str(skip)
+
+        response_data = self.handle_response(*await self._request("POST", url, data))
+        return response_data.get("docs", [])
+
+    async def aquery(
+        self,
+        query: str,
+        filter: dict = None,
+        projection: dict = None,
+        emb_model: str = None,
+        top_k: int = None,
+        include_values: bool = None,
+    ) -> QueryResponse:
+        """Perform semantic search on the collection."""
+        url = self._query_url
+
+        data = {"query": query}
+
+        if filter is not None:
+            data["filter"] = self._encode(filter)
+        if projection is not None:
+            data["projection"] = dumps(projection)
+        if emb_model is not None:
+            data["emb_model"] = emb_model
+        if top_k is not None:
+            data["top_k"] = str(top_k)
+        if include_values is not None:
+            data["include_values"] = str(include_values).lower()
+
+        response_data = self.handle_response(*await self._request("POST", url, data))
+        return response_data.get("matches", [])
+
+    async def aquery_many(self, queries: list[str], **kwargs) -> list[QueryResponse]:
+        """Run several semantic searches concurrently; results keep input order."""
+        return list(
+            await asyncio.gather(*(self.aquery(query, **kwargs) for query in queries))
+        )
+
+    async def adrop(self) -> None:
+        """Delete the entire collection."""
+        url = self._collection_url
+
+        status, body = await self._request("DELETE", url, {})
+        if status == 204:
+            return None
+
+        self.handle_response(status, body)
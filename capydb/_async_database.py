@@ -0,0 +1,47 @@
+from typing import Any, Callable
+from capydb._async_collection import AsyncCollection
+from capydb._serialization import encode
+
+class AsyncDatabase:
+    """Database in CapyDB for use with AsyncCapyDB."""
+
+    def __init__(
+        self,
+        api_key: str,
+        project_id: str,
+        db_name: str,
+        get_session: Callable,
+        encoder: Callable[[Any], bytes] = encode,
+    ):
+        """Initialize database instance."""
+        self.api_key = api_key
+        self.project_id = project_id
+        self.db_name = db_name
+        self._get_session = get_session
+        self._encoder = encoder
+        self._collections: dict[str, AsyncCollection] = {}
+
+    def collection(self, collection_name: str) -> AsyncCollection:
+        """Get collection by name; repeated lookups return the same instance."""
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self._collections.setdefault(
+                collection_name,
+                AsyncCollection(
+                    self.api_key,
+                    self.project_id,
+                    self.db_name,
+                    collection_name,
+                    self._get_session,
+                    encoder=self._encoder,
+                ),
+            )
+        return collection
+
+    def __getattr__(self, name: str) -> AsyncCollection:
+        """Allow collection access via attribute: db.my_collection"""
+        return self.collection(name)
+
+    def __getitem__(self, name: str) -> AsyncCollection:
+        """Allow collection access via dictionary: db["my_collection"]"""
+        return self.collection(name)
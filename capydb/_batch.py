@@ -0,0 +1,138 @@
+import threading
+from typing import Optional, Union
+
+
+class BatchingCollection:
+    """Buffers inserts for a Collection and sends them as batched requests.
+
+    A batch is sent once max_docs documents are buffered or max_latency_ms
+    has passed since the first buffered document, whichever comes first.
+    Responses of the sent batches are collected in ``results``; batches whose
+    request failed are kept with their error in ``failed``, and documents not
+    sent yet are available from ``pending``. Batches are sent one at a time,
+    in the order they were buffered.
+    """
+
+    def __init__(self, collection, max_docs: int = 500, max_latency_ms: int = 50):
+        """Initialize batching wrapper around a collection."""
+        if max_docs < 1:
+            raise ValueError("max_docs must be at least 1.")
+
+        self.collection = collection
+        self.max_docs = max_docs
+        self.max_latency_ms = max_latency_ms
+        self.results: list[dict] = []
+        self.failed: list[tuple[list[dict], BaseException]] = []
+        self._buffer: list[dict] = []
+        self._lock = threading.Lock()
+        # Held for the whole take-and-send of a batch, so batches reach the
+        # server in order and flush() waits for one the timer is sending
+        self._send_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def pending(self) -> list[dict]:
+        """Documents buffered but not sent yet."""
+        with self._lock:
+            return list(self._buffer)
+
+    def insert(self, documents: Union[dict, list[dict]]) -> None:
+        """Buffer one or more documents for insertion.
+
+        If a batch sent in the background failed since the last call, its
+        error is raised after the documents have been buffered.
+        """
+        if isinstance(documents, dict):
+            documents = [documents]
+
+        with self._lock:
+            self._buffer.extend(documents)
+            full = len(self._buffer) >= self.max_docs
+            if not full and self._timer is None and self._buffer:
+                self._timer = threading.Timer(
+                    self.max_latency_ms / 1000, self._flush_on_timer
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self._send_buffer()
+        self._raise_pending_error()
+
+    def flush(self) -> None:
+        """Send all buffered documents now, then raise any background failure.
+
+        Waits for a batch the timer is already sending.
+        """
+        self._send_buffer()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush remaining documents; the wrapper should not be used afterwards.
+
+        Returns once every batch has been sent, and raises a background
+        failure that was not raised yet.
+        """
+        self.flush()
+
+    def _take_buffer(self) -> list[dict]:
+        # Caller must hold self._lock
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _send_buffer(self) -> None:
+        with self._send_lock:
+            with self._lock:
+                batch = self._take_buffer()
+            if batch:
+                self._send(batch)
+
+    def _send(self, batch: list[dict]) -> None:
+        # Caller must hold self._send_lock
+        try:
+            result = self.collection.insert(batch)
+        except BaseException as e:
+            with self._lock:
+                self.failed.append((batch, e))
+            raise
+
+        with self._lock:
+            self.results.append(result)
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            # A flush may have replaced this timer while it was firing
+            if self._timer is threading.current_thread():
+                self._timer = None
+        try:
+            self._send_buffer()
+        except BaseException as e:
+            # Already recorded in self.failed; surfaced on the caller's next
+            # call. Keep the first error if several batches failed meanwhile.
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+
+    def _raise_pending_error(self) -> None:
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> "BatchingCollection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Leave unsent documents in pending and failures in failed when
+            # the block itself raised
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
@@ -1,38 +1,119 @@
 import os
+from typing import Any, Callable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from capydb._database import Database
+from capydb._http2 import (
+    HTTP2Session,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+)
+from capydb._serialization import BINARY_ENCODINGS, DATE_ENCODINGS, make_encoder
+
+
+def _load_credentials() -> tuple[str, str]:
+    """Read project ID and API key from the environment."""
+    project_id = os.getenv("CAPYDB_PROJECT_ID", "")
+    api_key = os.getenv("CAPYDB_API_KEY", "")
+
+    if not project_id:
+        raise ValueError(
+            "Missing Project ID: Please provide the Project ID as an argument or set it in the CAPYDB_PROJECT_ID environment variable. "
+            "Tip: Ensure your environment file (e.g., .env) is loaded."
+        )
+
+    if not api_key:
+        raise ValueError(
+            "Missing API Key: Please provide the API Key as an argument or set it in the CAPYDB_API_KEY environment variable. "
+            "Tip: Ensure your environment file (e.g., .env) is loaded."
+        )
+
+    return project_id, api_key
+
+
+def _env_choice(name: str, choices: tuple[str, ...]) -> str:
+    """Read a setting from the environment; the first choice is the default."""
+    value = os.getenv(name, choices[0])
+    if value not in choices:
+        supported_list = ", ".join(choices)
+        raise ValueError(f"Invalid {name}: '{value}'. Supported values are: {supported_list}")
+    return value
+
+
+def _load_encoder() -> Callable[[Any], bytes]:
+    """Read the wire format settings from the environment and return their encoder."""
+    binary_encoding = _env_choice("CAPYDB_BINARY_ENCODING", BINARY_ENCODINGS)
+    date_encoding = _env_choice("CAPYDB_DATE_ENCODING", DATE_ENCODINGS)
+    return make_encoder(binary_encoding, date_encoding)
+
+
+def _create_session(headers: dict) -> requests.Session:
+    """Create the pooled requests session shared by every collection."""
+    session = requests.Session()
+    session.headers.update(headers)
+    # Transient failures are retried on the pooled connection with backoff;
+    # once retries run out the last response is handled as usual.
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=50, pool_maxsize=100, max_retries=retry),
+    )
+    return session
 
 
 class CapyDB:
     """Client for interacting with CapyDB.
     
     Requires CAPYDB_PROJECT_ID and CAPYDB_API_KEY environment variables.
+    On deployments that accept canonical Extended JSON, set
+    CAPYDB_BINARY_ENCODING=base64 to send Binary values base64-encoded
+    instead of hex, and CAPYDB_DATE_ENCODING=epoch to send datetimes as
+    epoch milliseconds instead of ISO strings (dates then come back as naive
+    UTC datetimes, as in pymongo). Both are read when the client
+    is created, so each client can target its own deployment.
+
+    Pass http2=True to multiplex requests over HTTP/2 (requires the optional
+    httpx dependency); the default transport is a pooled requests.Session.
+    Both retry connection errors and 429/5xx responses with backoff.
     """
     
-    def __init__(self):
+    def __init__(self, http2: bool = False):
         """Initialize CapyDB client from environment variables."""
-        self.project_id = os.getenv("CAPYDB_PROJECT_ID", "")
-        self.api_key = os.getenv("CAPYDB_API_KEY", "")
-
-        if not self.project_id:
-            raise ValueError(
-                "Missing Project ID: Please provide the Project ID as an argument or set it in the CAPYDB_PROJECT_ID environment variable. "
-                "Tip: Ensure your environment file (e.g., .env) is loaded."
-            )
-
-        if not self.api_key:
-            raise ValueError(
-                "Missing API Key: Please provide the API Key as an argument or set it in the CAPYDB_API_KEY environment variable. "
-                "Tip: Ensure your environment file (e.g., .env) is loaded."
-            )
+        self._databases: dict[str, Database] = {}
+        self.project_id, self.api_key = _load_credentials()
+        self._encoder = _load_encoder()
 
         self.base_url = f"https://api.capydb.com/{self.project_id}".rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        if http2:
+            self.session = HTTP2Session(headers)
+        else:
+            self.session = _create_session(headers)
 
     def db(self, db_name: str) -> Database:
-        """Get database by name."""
-        return Database(self.api_key, self.project_id, db_name)
+        """Get database by name; repeated lookups return the same instance."""
+        database = self._databases.get(db_name)
+        if database is None:
+            database = self._databases.setdefault(
+                db_name,
+                Database(
+                    self.api_key,
+                    self.project_id,
+                    db_name,
+                    session=self.session,
+                    encoder=self._encoder,
+                ),
+            )
+        return database
 
     def __getattr__(self, name):
         """Allow db access via attribute: client.my_database"""
@@ -1,34 +1,16 @@
-from bson import (
-    Code,
-    MaxKey,
-    MinKey,
-    Regex,
-    Timestamp,
-    ObjectId,
-    Decimal128,
-    Binary,
-)
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+from typing import Any, Callable, Iterator, Optional, Union
 import requests
-import json
 from ._types import QueryResponse
-from ._ejson._text import Text
-from ._ejson._image import Image
-
-# Serialization for BSON types
-BSON_SERIALIZERS = {
-    Text: lambda v: {"xText": v.to_json()},
-    Image: lambda v: {"xImage": v.to_json()},
-    ObjectId: lambda v: {"$oid": str(v)},
-    datetime: lambda v: {"$date": v.isoformat()},
-    Decimal128: lambda v: {"$numberDecimal": str(v)},
-    Binary: lambda v: {"$binary": v.hex()},
-    Regex: lambda v: {"$regex": v.pattern, "$options": v.flags},
-    Code: lambda v: {"$code": str(v)},
-    Timestamp: lambda v: {"$timestamp": {"t": v.time, "i": v.inc}},
-    MinKey: lambda v: {"$minKey": 1},
-    MaxKey: lambda v: {"$maxKey": 1},
-}
+from ._batch import BatchingCollection
+from ._http2 import HTTP2Session
+from ._serialization import BSON_SERIALIZERS, deserialize, dumps, encode, loads
+
+try:
+    import ijson
+except ImportError:  # optional dependency, installed with the "stream" extra
+    ijson = None
 
 
 class APIClientError(Exception):
@@ -55,11 +37,62 @@ class ServerError(APIClientError):
     pass
 
 
+def _api_error(code: int, message: str) -> APIClientError:
+    """Map an API error code to the matching exception type."""
+    if code == 401:
+        return AuthenticationError(code, message)
+    elif code >= 400 and code < 500:
+        return ClientRequestError(code, message)
+    else:
+        return ServerError(code, message)
+
+
+def _parse_response(status_code: int, body: bytes):
+    """Decode a response body once; raise the matching APIClientError on error statuses."""
+    if status_code < 400:
+        return deserialize(loads(body)) if body else None
+
+    try:
+        error_data = loads(body) if body else None
+    except ValueError:
+        error_data = None
+
+    if isinstance(error_data, dict):
+        code = error_data.get("code", status_code)
+        message = error_data.get("message", "An unknown error occurred.")
+    else:
+        # Not a JSON error payload (e.g. from a proxy); classify by HTTP status
+        code = status_code
+        message = body.decode("utf-8", "replace") or "An unknown error occurred."
+
+    raise _api_error(code, message)
+
+
+def _merge_responses(responses: list[dict]) -> dict:
+    """Merge shard responses: concatenate lists, sum counts, keep other first values."""
+    merged = {}
+    for response in responses:
+        for key, value in response.items():
+            if key not in merged:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list):
+                merged[key].extend(value)
+            elif isinstance(value, int) and not isinstance(value, bool):
+                merged[key] += value
+    return merged
+
+
 class Collection:
     """Collection in CapyDB for document operations and semantic search."""
     
     def __init__(
-        self, api_key: str, project_id: str, db_name: str, collection_name: str
+        self,
+        api_key: str,
+        project_id: str,
+        db_name: str,
+        collection_name: str,
+        session: Optional[Union[requests.Session, HTTP2Session]] = None,
+        encoder: Callable[[Any], bytes] = encode,
     ):
         """Initialize collection instance."""
         self.api_key = api_key
@@ -67,144 +100,95 @@ class Collection:
         self.db_name = db_name
         self.collection_name = collection_name
 
-    def get_collection_url(self) -> str:
-        return f"https://api.capydb.com/v1/db/{self.project_id}_{self.db_name}/collection/{self.collection_name}/document"
+        # Endpoints never change for a collection, build them once
+        self._collection_url = f"https://api.capydb.com/v1/db/{project_id}_{db_name}/collection/{collection_name}"
+        self._document_url = f"{self._collection_url}/document"
+        self._find_url = f"{self._document_url}/find"
+        self._query_url = f"{self._document_url}/query"
 
-    def get_headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
-    def __serialize(self, value):
-        """Serialize BSON types, Text, and nested structures into JSON-compatible formats."""
-        if value is None or isinstance(value, (bool, int, float, str)):
-            return value
-
-        if isinstance(value, dict):
-            return {k: self.__serialize(v) for k, v in value.items()}
+        self._headers = {"Authorization": f"Bearer {api_key}"}
 
-        if isinstance(value, list):
-            return [self.__serialize(item) for item in value]
-
-        if isinstance(value, Text):
-            return value.to_json()
-            
-        if isinstance(value, Image):
-            return value.to_json()
-
-        serializer = BSON_SERIALIZERS.get(type(value))
-        if serializer:
-            return serializer(value)
-
-        raise TypeError(f"Unsupported BSON type: {type(value)}")
-
-    def __deserialize(self, value, depth=0):
-        """Convert JSON-compatible structures back to BSON types and Text."""
-        if isinstance(value, dict):
-            for key in value:
-                if "xText" in value:
-                    return Text.from_json(value)
-                if "xImage" in value:
-                    return Image.from_json(value)
-                elif key.startswith("$"):
-                    if key == "$oid":
-                        return ObjectId(value["$oid"])
-                    if key == "$date":
-                        return datetime.fromisoformat(value["$date"])
-                    if key == "$numberDecimal":
-                        return Decimal128(value["$numberDecimal"])
-                    if key == "$binary":
-                        return Binary(bytes.fromhex(value["$binary"]))
-                    if key == "$regex":
-                        return Regex(value["$regex"], value.get("$options", 0))
-                    if key == "$code":
-                        return Code(value["$code"])
-                    if key == "$timestamp":
-                        return Timestamp(
-                            value["$timestamp"]["t"], value["$timestamp"]["i"]
-                        )
-                    if key == "$minKey":
-                        return MinKey()
-                    if key == "$maxKey":
-                        return MaxKey()
-
-            return {k: self.__deserialize(v, depth + 1) for k, v in value.items()}
-
-        elif isinstance(value, list):
-            return [self.__deserialize(item, depth + 1) for item in value]
-
-        elif value is None:
-            return None
+        # Reuse the client's pooled session; standalone collections get their own
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+        self._session = session
+        # Wire formats are chosen by the client, see make_encoder()
+        self._encode = encoder
 
-        elif isinstance(value, (bool, int, float, str)):
-            return value
+    def get_collection_url(self) -> str:
+        return self._document_url
 
-        else:
-            raise TypeError(
-                f"Unsupported BSON type during deserialization: {type(value)}"
-            )
+    def get_headers(self) -> dict:
+        """Deprecated: auth headers are set once on the shared session."""
+        warnings.warn(
+            "Collection.get_headers() is deprecated; requests are authenticated "
+            "by the client session.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return dict(self._headers)
 
     def handle_response(self, response):
-        try:
-            response.raise_for_status()
-            json_response = response.json()
-            return self.__deserialize(json_response)
-        except requests.exceptions.HTTPError as e:
-            try:
-                error_data = response.json()
-                status = error_data.get("status", "error")
-                code = error_data.get("code", 500)
-                message = error_data.get("message", "An unknown error occurred.")
-
-                if code == 401:
-                    raise AuthenticationError(code, message) from e
-                elif code >= 400 and code < 500:
-                    raise ClientRequestError(code, message) from e
-                else:
-                    raise ServerError(code, message) from e
-
-            except ValueError:
-                raise APIClientError(response.status_code, response.text) from e
-
-    def insert(self, documents: list[dict]) -> dict:
-        """Insert documents into the collection."""
-        url = self.get_collection_url()
-        headers = self.get_headers()
-        serialized_docs = [self.__serialize(doc) for doc in documents]
+        return _parse_response(response.status_code, response.content)
+
+    def insert(
+        self, documents: list[dict], shard_size: int = 500, max_workers: int = 8
+    ) -> dict:
+        """Insert documents into the collection.
+
+        Lists longer than shard_size are split into shards that are sent
+        concurrently (up to max_workers at a time) and their responses merged.
+        If a shard fails the error is raised, but other shards may already
+        have been inserted.
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1.")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        if len(documents) <= shard_size:
+            return self._insert_shard(documents)
+
+        shards = [
+            documents[i : i + shard_size] for i in range(0, len(documents), shard_size)
+        ]
+        # The pooled session is thread-safe as long as pool_maxsize >= max_workers
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(shards))) as executor:
+            responses = list(executor.map(self._insert_shard, shards))
+        return _merge_responses(responses)
+
+    def _insert_shard(self, documents: list[dict]) -> dict:
+        url = self._document_url
         
         files = {}
-        data = {"documents": json.dumps(serialized_docs)}
+        data = {"documents": self._encode(documents)}
 
-        response = requests.post(url, headers=headers, files=files, data=data)
+        response = self._session.post(url, files=files, data=data)
         return self.handle_response(response)
 
     def update(self, filter: dict, update: dict, upsert: bool = False) -> dict:
         """Update documents matching filter."""
-        url = self.get_collection_url()
-        headers = self.get_headers()
-        transformed_filter = self.__serialize(filter)
-        transformed_update = self.__serialize(update)
+        url = self._document_url
         
         files = {}
         data = {
-            "filter": json.dumps(transformed_filter),
-            "update": json.dumps(transformed_update),
+            "filter": self._encode(filter),
+            "update": self._encode(update),
             "upsert": str(upsert).lower(),
         }
 
-        response = requests.put(url, headers=headers, files=files, data=data)
+        response = self._session.put(url, files=files, data=data)
         return self.handle_response(response)
 
     def delete(self, filter: dict) -> dict:
         """Delete documents matching filter."""
-        url = self.get_collection_url()
-        headers = self.get_headers()
-        transformed_filter = self.__serialize(filter)
+        url = self._document_url
         
         files = {}
-        data = {"filter": json.dumps(transformed_filter)}
+        data = {"filter": self._encode(filter)}
 
-        response = requests.delete(url, headers=headers, files=files, data=data)
+        response = self._session.delete(url, files=files, data=data)
         return self.handle_response(response)
 
     def find(
@@ -216,25 +200,68 @@ class Collection:
         skip: int = None,
     ) -> list[dict]:
         """Find documents matching filter."""
-        url = f"{self.get_collection_url()}/find"
-        headers = self.get_headers()
-        transformed_filter = self.__serialize(filter)
+        url = self._find_url
         
         files = {}
-        data = {"filter": json.dumps(transformed_filter)}
+        data = self._find_data(filter, projection, sort, limit, skip)
+
+        response = self._session.post(url, files=files, data=data)
+        response_data = self.handle_response(response)
+        return response_data.get("docs", [])
+
+    def find_iter(
+        self,
+        filter: dict,
+        projection: dict = None,
+        sort: dict = None,
+        limit: int = None,
+        skip: int = None,
+    ) -> Iterator[dict]:
+        """Find documents matching filter, yielding each one as the response streams in.
+
+        Memory stays flat however large the result set is, at the cost of some
+        per-document overhead compared to find(). Requires the optional ijson
+        dependency (pip install "capydb[stream]").
+        """
+        if ijson is None:
+            raise ImportError(
+                "find_iter requires ijson. Install it with: pip install \"capydb[stream]\""
+            )
+
+        url = self._find_url
+
+        files = {}
+        data = self._find_data(filter, projection, sort, limit, skip)
+
+        # Closing the response (also on early generator exit) releases the connection
+        with self._session.post(url, files=files, data=data, stream=True) as response:
+            if response.status_code >= 400:
+                self.handle_response(response)
+
+            response.raw.decode_content = True
+            for doc in ijson.items(response.raw, "docs.item", use_float=True):
+                yield deserialize(doc)
+
+    def _find_data(
+        self,
+        filter: dict,
+        projection: Optional[dict],
+        sort: Optional[dict],
+        limit: Optional[int],
+        skip: Optional[int],
+    ) -> dict:
+        data = {"filter": self._encode(filter)}
         
         if projection is not None:
-            data["projection"] = json.dumps(projection)
+            data["projection"] = dumps(projection)
         if sort is not None:
-            data["sort"] = json.dumps(sort)
+            data["sort"] = dumps(sort)
         if limit is not None:
             data["limit"] = str(limit)
         if skip is not None:
             data["skip"] = str(skip)
 
-        response = requests.post(url, headers=headers, files=files, data=data)
-        response_data = self.handle_response(response)
-        return response_data.get("docs", [])
+        return data
 
     def query(
         self,
@@ -246,16 +273,15 @@ class Collection:
         include_values: bool = None,
     ) -> QueryResponse:
         """Perform semantic search on the collection."""
-        url = f"{self.get_collection_url()}/query"
-        headers = self.get_headers()
+        url = self._query_url
 
         files = {}
         data = {"query": query}
         
         if filter is not None:
-            data["filter"] = json.dumps(self.__serialize(filter))
+            data["filter"] = self._encode(filter)
         if projection is not None:
-            data["projection"] = json.dumps(projection)
+            data["projection"] = dumps(projection)
         if emb_model is not None:
             data["emb_model"] = emb_model
         if top_k is not None:
@@ -263,19 +289,43 @@ class Collection:
         if include_values is not None:
             data["include_values"] = str(include_values).lower()
 
-        response = requests.post(url, headers=headers, files=files, data=data)
+        response = self._session.post(url, files=files, data=data)
         response_data = self.handle_response(response)
         return response_data.get("matches", [])
 
+    def query_many(
+        self, queries: list[str], max_workers: int = 8, **kwargs
+    ) -> list[QueryResponse]:
+        """Run several semantic searches concurrently; results keep input order.
+
+        Extra keyword arguments are passed to query() for every query.
+        """
+        if not queries:
+            return []
+
+        # The pooled session is thread-safe as long as pool_maxsize >= max_workers
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(lambda q: self.query(q, **kwargs), queries))
+
+    def batch(self, max_docs: int = 500, max_latency_ms: int = 50) -> BatchingCollection:
+        """Buffer inserts and send them in batches.
+
+        Use as a context manager; remaining documents are flushed on exit:
+
+            with collection.batch() as batch:
+                for doc in docs:
+                    batch.insert(doc)
+        """
+        return BatchingCollection(self, max_docs=max_docs, max_latency_ms=max_latency_ms)
+
     def drop(self) -> None:
         """Delete the entire collection."""
-        url = f"https://api.capydb.com/v1/db/{self.project_id}_{self.db_name}/collection/{self.collection_name}"
-        headers = self.get_headers()
+        url = self._collection_url
         
         files = {}
         data = {}
         
-        response = requests.delete(url, headers=headers, files=files, data=data)
+        response = self._session.delete(url, files=files, data=data)
         if response.status_code == 204:
             return None
             
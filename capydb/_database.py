@@ -1,17 +1,44 @@
+from typing import Any, Callable, Optional, Union
+import requests
 from capydb._collection import Collection
+from capydb._http2 import HTTP2Session
+from capydb._serialization import encode
 
 class Database:
     """Database in CapyDB."""
     
-    def __init__(self, api_key: str, project_id: str, db_name: str):
+    def __init__(
+        self,
+        api_key: str,
+        project_id: str,
+        db_name: str,
+        session: Optional[Union[requests.Session, HTTP2Session]] = None,
+        encoder: Callable[[Any], bytes] = encode,
+    ):
         """Initialize database instance."""
         self.api_key = api_key
         self.project_id = project_id
         self.db_name = db_name
+        self._session = session
+        self._encoder = encoder
+        self._collections: dict[str, Collection] = {}
 
     def collection(self, collection_name: str) -> Collection:
-        """Get collection by name."""
-        return Collection(self.api_key, self.project_id, self.db_name, collection_name)
+        """Get collection by name; repeated lookups return the same instance."""
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self._collections.setdefault(
+                collection_name,
+                Collection(
+                    self.api_key,
+                    self.project_id,
+                    self.db_name,
+                    collection_name,
+                    session=self._session,
+                    encoder=self._encoder,
+                ),
+            )
+        return collection
 
     def __getattr__(self, name: str) -> Collection:
         """Allow collection access via attribute: db.my_collection"""
@@ -0,0 +1,173 @@
+import io
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+try:
+    import httpx
+except ImportError:  # optional dependency, installed with the "http2" extra
+    httpx = None
+
+# Retry policy shared by both transports (see _create_session in _client)
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Statuses for which a Retry-After header is honoured, as in urllib3
+RETRY_AFTER_STATUSES = (413, 429, 503)
+RETRY_BACKOFF_MAX = 120
+
+
+class HTTP2Session:
+    """HTTP/2 transport exposing the subset of requests.Session used by Collection.
+
+    Backed by an httpx.Client, so concurrent requests are multiplexed over
+    a single TLS connection instead of one socket each. Transient failures
+    get the same retry policy as the default transport: connection errors and
+    429/5xx responses are retried with exponential backoff, honouring
+    Retry-After.
+    """
+
+    def __init__(self, headers: dict):
+        """Initialize session with default headers."""
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires httpx. Install it with: pip install \"capydb[http2]\""
+            )
+
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        self._client = httpx.Client(
+            headers=headers,
+            # No read timeout, like requests; inserts wait on server-side embedding
+            timeout=httpx.Timeout(None, connect=30.0),
+            transport=httpx.HTTPTransport(http2=True, limits=limits),
+        )
+
+    @property
+    def headers(self):
+        return self._client.headers
+
+    def request(
+        self, method: str, url: str, data: dict = None, files=None, stream: bool = False
+    ):
+        """Send a form-encoded request; files is accepted for signature parity only."""
+        # httpx form values must be str; bytes would be sent as their repr
+        if data:
+            data = {k: v.decode() if isinstance(v, bytes) else v for k, v in data.items()}
+
+        request = self._client.build_request(method, url, data=data or None)
+        response = self._send_with_retry(request, stream)
+        return _StreamedResponse(response) if stream else response
+
+    def _send_with_retry(
+        self, request: "httpx.Request", stream: bool
+    ) -> "httpx.Response":
+        for attempt in range(RETRY_TOTAL + 1):
+            last_attempt = attempt == RETRY_TOTAL
+            try:
+                response = self._client.send(request, stream=stream)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                time.sleep(_backoff(attempt))
+                continue
+
+            if last_attempt or response.status_code not in RETRY_STATUSES:
+                # Once retries run out the last response is handled as usual
+                return response
+
+            delay = _retry_after(response)
+            response.close()
+            time.sleep(delay if delay is not None else _backoff(attempt))
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def _backoff(attempt: int) -> float:
+    # Same schedule as urllib3: no wait before the first retry, then doubling
+    if attempt == 0:
+        return 0.0
+    return min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_FACTOR * (2 ** attempt))
+
+
+def _retry_after(response: "httpx.Response") -> Optional[float]:
+    """Seconds to wait according to the Retry-After header, if any."""
+    if response.status_code not in RETRY_AFTER_STATUSES:
+        return None
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _StreamedResponse:
+    """Streaming httpx response with the requests-style raw/context manager API."""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status_code = response.status_code
+        self.raw = _IteratorReader(response.iter_bytes())
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        self._response.read()
+        return self._response.text
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self) -> "_StreamedResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class _IteratorReader(io.RawIOBase):
+    """File-like view over an iterator of byte chunks, as expected by ijson."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = b""
+        # Content is already decoded by httpx; set by callers for requests parity
+        self.decode_content = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b""
+                return 0
+
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
@@ -0,0 +1,318 @@
+from bson import (
+    Code,
+    MaxKey,
+    MinKey,
+    Regex,
+    Timestamp,
+    ObjectId,
+    Decimal128,
+    Binary,
+)
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+import functools
+import uuid
+from typing import Any, Callable
+import orjson
+from ._ejson._text import Text
+from ._ejson._image import Image
+
+"""Conversion between Python/BSON values and the JSON shapes sent to the API."""
+
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in, used when installed
+except ImportError:
+    import base64
+
+
+# Wire formats, first choice is the default. The defaults are what existing
+# deployments accept; the alternatives are the canonical Extended JSON shapes,
+# which are smaller: Binary as {"$binary": {"base64", "subType"}} and datetime
+# as {"$date": {"$numberLong": "<ms since epoch>"}}. Both are chosen per
+# client, see make_encoder().
+BINARY_ENCODINGS = ("hex", "base64")
+DATE_ENCODINGS = ("iso", "epoch")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def _encode_binary_base64(value: Binary) -> dict:
+    return {
+        "$binary": {
+            "base64": base64.b64encode(bytes(value)).decode("ascii"),
+            "subType": f"{value.subtype:02x}",
+        }
+    }
+
+
+def _decode_binary(value: dict) -> Binary:
+    # Accept both shapes regardless of the client's binary encoding
+    binary = value["$binary"]
+    if isinstance(binary, dict):
+        subtype = int(binary.get("subType", "00"), 16)
+        return Binary(base64.b64decode(binary["base64"]), subtype)
+    return Binary(bytes.fromhex(binary))
+
+
+def _encode_date_epoch(value: datetime) -> dict:
+    # Naive datetimes are taken as UTC, as in BSON
+    epoch = _EPOCH_NAIVE if value.tzinfo is None else _EPOCH
+    return {"$date": {"$numberLong": str((value - epoch) // _MILLISECOND)}}
+
+
+def _decode_date(value: dict) -> datetime:
+    # Accept ISO strings and epoch milliseconds regardless of the client's date encoding
+    date = value["$date"]
+    if isinstance(date, str):
+        return datetime.fromisoformat(date)
+    if isinstance(date, dict):
+        date = int(date["$numberLong"])
+    # Naive UTC, like pymongo's default tz_aware=False, so a naive datetime
+    # round-trips to the same type in either date encoding
+    return _EPOCH_NAIVE + timedelta(milliseconds=date)
+
+
+def _to_json(value):
+    # Text/Image.to_json() already returns the {"xText"/"xImage": ...} wrapper
+    return value.to_json()
+
+
+# Serialization for BSON types
+BSON_SERIALIZERS = {
+    Text: _to_json,
+    Image: _to_json,
+    ObjectId: lambda v: {"$oid": v.binary.hex()},
+    datetime: lambda v: {"$date": v.isoformat()},
+    Decimal128: lambda v: {"$numberDecimal": str(v)},
+    Binary: lambda v: {"$binary": v.hex()},
+    Regex: lambda v: {"$regex": v.pattern, "$options": v.flags},
+    Code: lambda v: {"$code": str(v)},
+    Timestamp: lambda v: {"$timestamp": {"t": v.time, "i": v.inc}},
+    MinKey: lambda v: {"$minKey": 1},
+    MaxKey: lambda v: {"$maxKey": 1},
+}
+
+
+def _identity(value):
+    return value
+
+
+def _serialize_dict(value: dict) -> dict:
+    return {k: serialize(v) for k, v in value.items()}
+
+
+def _serialize_list(value: list) -> list:
+    return [serialize(item) for item in value]
+
+
+# JSON-native leaf types returned as-is; exact type match, subclasses take the slow path
+_PRIMS = frozenset({type(None), bool, int, float, str})
+
+# Exact type -> handler; one dict lookup per node instead of an isinstance ladder.
+# The primitive entries serve subclasses (slow path). Tuples, UUIDs and enums
+# are listed because orjson encodes them natively, so encode() accepts them;
+# serialize() must produce the same JSON.
+_SERIALIZERS = {
+    **BSON_SERIALIZERS,
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    dict: _serialize_dict,
+    list: _serialize_list,
+    tuple: _serialize_list,
+    uuid.UUID: str,
+    Enum: lambda v: serialize(v.value),
+}
+
+
+def serialize(value, _prims=_PRIMS, _serializers=_SERIALIZERS):
+    """Serialize BSON types, Text, and nested structures into JSON-compatible formats."""
+    # Hot path: containers are walked inline and primitive children are kept
+    # without a recursive call. The comprehensions read the module-level
+    # _PRIMS; capturing the _prims default would turn it into a closure cell.
+    t = type(value)
+    if t in _prims:
+        return value
+    if t is dict:
+        return {
+            k: v if type(v) in _PRIMS else serialize(v) for k, v in value.items()
+        }
+    if t is list:
+        return [item if type(item) in _PRIMS else serialize(item) for item in value]
+
+    serializer = _serializers.get(t)
+    if serializer is None:
+        return _serialize_subclass(value)
+    return serializer(value)
+
+
+def _serialize_subclass(value):
+    """Slow path for subclasses of supported types, e.g. OrderedDict."""
+    for base in type(value).__mro__[1:]:
+        serializer = _SERIALIZERS.get(base)
+        if serializer is not None:
+            return serializer(value)
+
+    raise TypeError(f"Unsupported BSON type: {type(value)}")
+
+
+def dumps(value) -> bytes:
+    """Encode an already serialized value as compact JSON bytes.
+
+    Unlike json.dumps, integers outside the 64-bit range raise TypeError and
+    NaN/Infinity are encoded as null; store such values as Decimal128.
+    """
+    # json.dumps accepted non-string keys (e.g. ints), keep doing so
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Subclasses orjson passes to the default hook that it encodes natively once downcast
+_DOWNCASTS = {
+    bool: bool,
+    int: int,
+    float: float,
+    str: str,
+    dict: dict,
+    list: list,
+    tuple: list,
+}
+
+
+# Route datetimes, dataclasses and subclasses (e.g. Code, a str) through the
+# default hook
+_ENCODE_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+
+def _make_encode(serializers: dict) -> Callable[[Any], bytes]:
+    """Build a single-pass encode function around a serializer table."""
+
+    def default(value):
+        """orjson hook for values it does not encode natively."""
+        # Before the MRO walk: str()/int() of a mixed-in enum member is not its value
+        if isinstance(value, Enum):
+            return value.value
+
+        for cls in type(value).__mro__:
+            downcast = _DOWNCASTS.get(cls)
+            if downcast is not None:
+                # A plain copy keeps orjson from handing the subclass back; its
+                # children are then walked by orjson itself
+                return downcast(value)
+            serializer = serializers.get(cls)
+            if serializer is not None:
+                return serializer(value)
+
+        raise TypeError(f"Unsupported BSON type: {type(value)}")
+
+    def encode(value) -> bytes:
+        try:
+            return orjson.dumps(value, default=default, option=_ENCODE_OPTIONS)
+        except orjson.JSONEncodeError:
+            # orjson reports a failing default hook as a generic "not JSON
+            # serializable" error on the outer value; serialize() accepts the
+            # same types for every table and raises the real one
+            serialize(value)
+            raise
+
+    return encode
+
+
+_encode = _make_encode(_SERIALIZERS)
+
+
+def encode(value) -> bytes:
+    """Serialize and encode a value as JSON bytes in a single pass.
+
+    Produces the same bytes as dumps(serialize(value)), and raises the same
+    TypeError for unsupported types, without building the intermediate tree.
+    Uses the default wire formats; clients use make_encoder(). The same
+    integer range and NaN/Infinity caveats as dumps() apply.
+    """
+    return _encode(value)
+
+
+@functools.lru_cache(maxsize=None)
+def make_encoder(
+    binary_encoding: str = "hex", date_encoding: str = "iso"
+) -> Callable[[Any], bytes]:
+    """Return an encode() variant for the given wire formats.
+
+    Encoders are cached, so clients with the same settings share one.
+    """
+    if binary_encoding not in BINARY_ENCODINGS:
+        raise ValueError(f"Unsupported binary encoding: {binary_encoding!r}")
+    if date_encoding not in DATE_ENCODINGS:
+        raise ValueError(f"Unsupported date encoding: {date_encoding!r}")
+    if binary_encoding == "hex" and date_encoding == "iso":
+        return encode
+
+    serializers = dict(_SERIALIZERS)
+    if binary_encoding == "base64":
+        serializers[Binary] = _encode_binary_base64
+    if date_encoding == "epoch":
+        serializers[datetime] = _encode_date_epoch
+    return _make_encode(serializers)
+
+
+def loads(data: bytes):
+    """Decode a JSON response body."""
+    return orjson.loads(data)
+
+
+# Extended JSON marker key -> decoder for the wrapping dict
+_BSON_DECODERS = {
+    "$oid": lambda d: ObjectId(d["$oid"]),
+    "$date": _decode_date,
+    "$numberDecimal": lambda d: Decimal128(d["$numberDecimal"]),
+    "$binary": _decode_binary,
+    "$regex": lambda d: Regex(d["$regex"], d.get("$options", 0)),
+    "$code": lambda d: Code(d["$code"]),
+    "$timestamp": lambda d: Timestamp(d["$timestamp"]["t"], d["$timestamp"]["i"]),
+    "$minKey": lambda d: MinKey(),
+    "$maxKey": lambda d: MaxKey(),
+}
+
+
+def deserialize(value, _prims=_PRIMS, _decoders=_BSON_DECODERS):
+    """Convert JSON-compatible structures back to BSON types and Text."""
+    t = type(value)
+    if t in _prims:
+        return value
+
+    if t is dict or isinstance(value, dict):
+        if "xText" in value:
+            return Text.from_json(value)
+        if "xImage" in value:
+            return Image.from_json(value)
+
+        for key in value:
+            decoder = _decoders.get(key)
+            if decoder is not None:
+                return decoder(value)
+
+        return {
+            k: v if type(v) in _PRIMS else deserialize(v) for k, v in value.items()
+        }
+
+    elif t is list or isinstance(value, list):
+        return [item if type(item) in _PRIMS else deserialize(item) for item in value]
+
+    elif value is None:
+        return None
+
+    elif isinstance(value, (bool, int, float, str)):
+        return value
+
+    else:
+        raise TypeError(
+            f"Unsupported BSON type during deserialization: {type(value)}"
+        )